@@ -1,17 +1,46 @@
 import sys
 import os
 import json
+import hashlib
+import stat
+import threading
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QFileDialog, QLabel, QSlider, QListWidget, QStyle,
-    QSizePolicy, QDialog, QAbstractItemView, QComboBox, QListWidgetItem
+    QPushButton, QFileDialog, QLabel, QSlider, QListView, QStyle,
+    QSizePolicy, QDialog, QAbstractItemView, QComboBox
 )
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaDevices
-from PyQt6.QtCore import Qt, QUrl, QDir, QTime, QByteArray
-from PyQt6.QtGui import QPixmap, QResizeEvent, QCloseEvent
+from PyQt6.QtCore import (
+    Qt, QUrl, QByteArray, QAbstractListModel, QModelIndex, QSize, QTimer,
+    QObject, QRunnable, QThreadPool, pyqtSignal, qVersion
+)
+from PyQt6.QtGui import QPixmap, QImage, QImageReader, QResizeEvent, QCloseEvent
 from pypinyin import lazy_pinyin
 
 SETTINGS_FILE = "settings.json"
+# 缩放后乐谱图片的磁盘缓存目录，首次写入时创建
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "intuplayer", "thumbs")
+# Qt 6.4 之前切换声卡后需要重新设置播放源才能从新声卡出声，之后的版本可以直接替换输出
+RESOURCE_ON_DEVICE_SWITCH = tuple(int(v) for v in qVersion().split('.')[:2]) < (6, 4)
+
+# 文件名 -> 拼音排序键 的缓存，避免每次重载目录都重新调用 lazy_pinyin
+_PINYIN_KEY_CACHE: dict[str, str] = {}
+
+def _pkey(name):
+    """返回文件名的拼音排序键（带缓存，纯 ASCII 文件名直接返回）"""
+    k = _PINYIN_KEY_CACHE.get(name)
+    if k is None:
+        # 纯 ASCII 文件名经 lazy_pinyin 转换后与原名相同，无需转换
+        k = name if name.isascii() else ''.join(lazy_pinyin(name))
+        _PINYIN_KEY_CACHE[name] = k
+    return k
+
+def _is_hidden(entry):
+    """与 QDir 默认过滤一致，跳过隐藏文件（如 macOS 的 ._xxx.mp3）"""
+    if entry.name.startswith('.'):
+        return True
+    # Windows 上 DirEntry.stat() 直接使用目录读取结果，不会产生额外的系统调用
+    return os.name == 'nt' and bool(entry.stat().st_file_attributes & stat.FILE_ATTRIBUTE_HIDDEN)
 
 DARK_STYLE_SHEET = """
 QMainWindow, QDialog, QWidget {background-color: #2b2b2b; color: #f0f0f0;}
@@ -19,12 +48,13 @@ QPushButton {background-color: #505050; color: #f0f0f0; border: 1px solid #60606
 QPushButton:hover {background-color: #606060;}
 QPushButton:pressed {background-color: #707070;}
 QLabel {color: #f0f0f0;}
+QLabel#image_label {background-color: #3c3c3c; border: 1px solid #505050;}
 QSlider::groove:horizontal {border: 1px solid #505050; height: 8px; background: #3a3a3a; margin: 2px 0; border-radius: 4px;}
 QSlider::handle:horizontal {background: #0078d4; border: 1px solid #0078d4; width: 14px; margin: -3px 0; border-radius: 7px;}
 QSlider::add-page:horizontal {background: #505050;}
 QSlider::sub-page:horizontal {background: #0078d4;}
-QListWidget {background-color: #3c3c3c; color: #f0f0f0; border: 1px solid #505050; selection-background-color: #0078d4; selection-color: #ffffff;}
-QListWidget::item:hover {background-color: #555555;}
+QListView#playlist_view {background-color: #3c3c3c; color: #f0f0f0; border: 1px solid #505050; selection-background-color: #0078d4; selection-color: #ffffff;}
+QListView#playlist_view::item:hover {background-color: #555555;}
 """
 
 # =================== 进度条点击跳转：1 ===================
@@ -44,6 +74,98 @@ class ClickableSlider(QSlider):
             return
         super().mousePressEvent(event)
 
+# =================== 后台图片加载 ===================
+# 乐谱图片扩展名，同名图片有多种格式时按此顺序优先
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif')
+_IMAGE_EXT_RANK = {ext: i for i, ext in enumerate(IMAGE_EXTENSIONS)}
+
+# 目录 -> (目录修改时间, {小写文件名主干: 图片路径})，同一目录内切换曲目只需查字典
+_SIDECAR_CACHE: dict[str, tuple[float, dict[str, str]]] = {}
+
+def find_score_image(audio_path):
+    """查找与音频文件同名的图片，没有则返回 None"""
+    parent, name = os.path.split(audio_path)
+    try:
+        mtime = os.stat(parent).st_mtime
+    except OSError:
+        return None
+    cached = _SIDECAR_CACHE.get(parent)
+    if cached is None or cached[0] != mtime:
+        # 目录内容有变化（或首次访问）时扫描一次目录
+        # 在线程池中运行，目录无法读取或中途消失（如 U 盘拔出）时按没有图片处理，不能让异常抛出
+        best = {}
+        try:
+            with os.scandir(parent) as entries:
+                for e in entries:
+                    stem, ext = os.path.splitext(e.name)
+                    rank = _IMAGE_EXT_RANK.get(ext.lower())
+                    if rank is not None and e.is_file():
+                        key = stem.lower()
+                        if key not in best or rank < best[key][0]:
+                            best[key] = (rank, e.path)
+        except OSError:
+            return None
+        cached = (mtime, {key: path for key, (_, path) in best.items()})
+        _SIDECAR_CACHE[parent] = cached
+    return cached[1].get(os.path.splitext(name)[0].lower())
+
+def read_cached_image(image_path, target):
+    """读取图片；超过 target 的图片缩放一次后缓存到磁盘，按 (路径, 修改时间, 尺寸) 区分"""
+    try:
+        mtime = os.path.getmtime(image_path)
+    except OSError:
+        return QImage()
+    key = hashlib.blake2b(f"{image_path}|{mtime}".encode(), digest_size=16).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{key}_{target.width()}x{target.height()}.png")
+    if os.path.exists(cache_path):
+        image = QImage(cache_path)
+        if not image.isNull():
+            return image
+    # 让解码器直接输出目标尺寸（JPEG 可在 DCT 阶段按 1/2、1/4、1/8 缩小），不必先解码整幅原图
+    reader = QImageReader(image_path)
+    orig = reader.size()
+    downscale = orig.isValid() and (orig.width() > target.width() or orig.height() > target.height())
+    if downscale:
+        reader.setScaledSize(orig.scaled(target, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull() or not downscale:
+        return image
+    # 多个加载线程可能同时写同一缓存文件，先写各自的临时文件再替换，避免读到写了一半的图片
+    tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if image.save(tmp_path, "PNG"):
+            os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    # 缓存只是加速手段，写入失败时清理残留的临时文件即可
+    if os.path.exists(tmp_path):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return image
+
+class ImageLoaderSignals(QObject):
+    # (请求编号, 图片路径, 图片)
+    done = pyqtSignal(int, str, QImage)
+
+class ImageLoader(QRunnable):
+    """在线程池中查找并解码乐谱图片，结果通过排队信号送回主线程。
+    非 GUI 线程不能创建 QPixmap，因此这里只产出 QImage，由主线程转换。"""
+    def __init__(self, request_id, audio_path, target):
+        super().__init__()
+        self.request_id = request_id
+        self.audio_path = audio_path
+        # 图片最多显示到整个屏幕那么大，以屏幕可用区域作为缓存尺寸
+        self.target = target
+        self.signals = ImageLoaderSignals()
+
+    def run(self):
+        image_path = find_score_image(self.audio_path)
+        image = read_cached_image(image_path, self.target) if image_path else QImage()
+        self.signals.done.emit(self.request_id, image_path or "", image)
+
 # =================== 图片显示标签 ===================
 class ImageDisplayLabel(QLabel):
     def __init__(self, *args, **kwargs):
@@ -51,15 +173,26 @@ class ImageDisplayLabel(QLabel):
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setMinimumSize(1, 1)
-        self.setStyleSheet("background-color: #3c3c3c; border: 1px solid #505050;")
+        self.setObjectName("image_label") # 样式见 DARK_STYLE_SHEET 中的 QLabel#image_label
         self._original_pixmap = QPixmap()
+        # 上一次平滑缩放的结果，尺寸未变时直接复用
+        self._last_scaled_size = QSize()
+        self._last_scaled_pixmap = QPixmap()
+        # 缩放分两步：先用快速缩放立即显示，200ms 内没有新的缩放请求时再做一次平滑缩放
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(200)
+        self._smooth_timer.timeout.connect(self._smooth_scale_pixmap)
 
     def setOriginalPixmap(self, pixmap: QPixmap):
         self._original_pixmap = pixmap
+        self._last_scaled_size = QSize()
+        self._last_scaled_pixmap = QPixmap()
         if not self._original_pixmap.isNull():
             super().setText("")
             self._scale_pixmap()
         else:
+            self._smooth_timer.stop()
             super().setPixmap(QPixmap())
             super().setText("无图片")
 
@@ -67,29 +200,76 @@ class ImageDisplayLabel(QLabel):
         if self._original_pixmap.isNull(): return
         label_size = self.size()
         if label_size.width() <= 0 or label_size.height() <= 0: return
-        scaled_pixmap = self._original_pixmap.scaled(
-            label_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-        )
-        super().setPixmap(scaled_pixmap)
+        if label_size == self._last_scaled_size:
+            self._smooth_timer.stop()
+            super().setPixmap(self._last_scaled_pixmap)
+            return
+        super().setPixmap(self._original_pixmap.scaled(
+            label_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation
+        ))
+        # 重新计时：连续调整大小或快速切换曲目时，之前未执行的平滑缩放自然作废
+        self._smooth_timer.start()
+
+    def _smooth_scale_pixmap(self):
+        if self._original_pixmap.isNull(): return
+        label_size = self.size()
+        if label_size.width() <= 0 or label_size.height() <= 0: return
+        if label_size != self._last_scaled_size:
+            self._last_scaled_pixmap = self._original_pixmap.scaled(
+                label_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
+            self._last_scaled_size = label_size
+        super().setPixmap(self._last_scaled_pixmap)
 
     def resizeEvent(self, event: QResizeEvent):
         if event.oldSize() != event.size():
             self._scale_pixmap()
         super().resizeEvent(event)
 
+# =================== 播放列表数据模型 ===================
+class PlaylistModel(QAbstractListModel):
+    """以文件路径列表为数据源的虚拟列表，只有可见行才会生成显示文本"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._files = []
+        self._names = []
+
+    def set_files(self, files, names):
+        # 整体替换数据源，视图只重置一次，而不是逐项插入
+        self.beginResetModel()
+        self._files = files
+        self._names = names
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._files)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._files[index.row()]
+        return None
+
 # =================== 播放列表 ===================
 class PlaylistDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, model, parent=None):
         super().__init__(parent)
         self.setWindowTitle("播放列表")
         self.setGeometry(200, 200, 300, 400)
         self.parent = parent
         layout = QVBoxLayout()
         self.setLayout(layout)
-        self.playlist_widget = QListWidget()
-        self.playlist_widget.itemDoubleClicked.connect(self.item_double_clicked)
-        self.playlist_widget.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        layout.addWidget(self.playlist_widget)
+        self.playlist_view = QListView()
+        self.playlist_view.setObjectName("playlist_view") # 样式见 DARK_STYLE_SHEET 中的 QListView#playlist_view
+        self.playlist_view.setModel(model)
+        self.playlist_view.setUniformItemSizes(True) # 所有行等高，免去逐行测量
+        self.playlist_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.playlist_view.setBatchSize(100)
+        self.playlist_view.doubleClicked.connect(self.item_double_clicked)
+        self.playlist_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        layout.addWidget(self.playlist_view)
         
         # ********************** 播放列表按钮布局修改 **********************
         button_layout = QHBoxLayout()
@@ -106,9 +286,9 @@ class PlaylistDialog(QDialog):
         layout.addLayout(button_layout)
         # ***************************************************************
 
-    def item_double_clicked(self, item):
+    def item_double_clicked(self, index):
         if self.parent:
-            file_path = item.data(Qt.ItemDataRole.UserRole)
+            file_path = index.data(Qt.ItemDataRole.UserRole)
             if file_path:
                 self.parent.playlist_file_double_clicked(file_path)
                 self.close()
@@ -120,9 +300,15 @@ class PlaylistDialog(QDialog):
             self.parent.reload_current_directory_playlist()
     # *******************************************************
 
+    def set_current_row(self, row):
+        self.playlist_view.setCurrentIndex(self.playlist_view.model().index(row))
+
 # =================== 主播放器 ===================
 class AudioPlayer(QMainWindow):
     AUDIO_EXTENSIONS = ('.mp3', '.wav', '.flac', '.ogg', '.m4a')
+    # 由 AUDIO_EXTENSIONS 派生的常量，只在类定义时计算一次
+    AUDIO_FILTER_STR = f"音频文件 ({' '.join('*' + e for e in AUDIO_EXTENSIONS)})"
+    AUDIO_EXT_LOWER = tuple(e.lower() for e in AUDIO_EXTENSIONS)
 
     def __init__(self):
         super().__init__()
@@ -138,6 +324,13 @@ class AudioPlayer(QMainWindow):
         
         self.load_settings()
 
+        # 设置延迟写盘：标记为脏后 1 秒内的多次修改合并为一次保存
+        self._settings_dirty = False
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(1000)
+        self._settings_timer.timeout.connect(self.save_settings)
+
         # 恢复窗口位置和大小
         if self.window_geometry:
             self.restoreGeometry(self.window_geometry)
@@ -147,11 +340,12 @@ class AudioPlayer(QMainWindow):
         self.player = QMediaPlayer()
         # 按照描述升序排列声卡
         self.audio_devices = sorted(QMediaDevices.audioOutputs(), key=lambda d: d.description()) 
+        device_descs = [d.description() for d in self.audio_devices]
 
         # 默认声卡
         if self.audio_devices:
-            default_device = next((d for d in self.audio_devices if d.description() == self.last_device_desc),
-                                  self.audio_devices[0])
+            last_index = device_descs.index(self.last_device_desc) if self.last_device_desc in device_descs else 0
+            default_device = self.audio_devices[last_index]
             self.audio_output = QAudioOutput(default_device)
         else:
             self.audio_output = QAudioOutput()
@@ -159,7 +353,13 @@ class AudioPlayer(QMainWindow):
 
         # 播放列表
         self.playlist = []
+        self._path_to_index: dict[str, int] = {} # 路径 -> 在 playlist 中的位置
         self.current_index = -1
+        self.playlist_model = PlaylistModel(self)
+
+        # 图片加载请求编号，用于丢弃过期的后台加载结果
+        self._image_request_id = 0
+        self.current_image_path = None
 
         # 主布局
         main_container = QWidget()
@@ -183,6 +383,9 @@ class AudioPlayer(QMainWindow):
         self.position_slider = ClickableSlider(Qt.Orientation.Horizontal) 
 
         self.position_slider.setRange(0, 0)
+        # 上一次显示的位置/时长（秒），用于跳过同一秒内的重复刷新
+        self._last_position_sec = -1
+        self._last_duration_sec = -1
         self.position_slider.sliderMoved.connect(self.set_position)
         progress_layout.addWidget(self.position_label)
         progress_layout.addWidget(self.position_slider, 1)
@@ -213,8 +416,8 @@ class AudioPlayer(QMainWindow):
 
         # QComboBox 用于显示和选择声卡
         self.device_combo = QComboBox()
-        self.device_combo.addItems([d.description() for d in self.audio_devices])
-        if self.last_device_desc in [d.description() for d in self.audio_devices]:
+        self.device_combo.addItems(device_descs)
+        if self.last_device_desc in device_descs:
             self.device_combo.setCurrentText(self.last_device_desc)
 
         # 选中声卡后自动收回列表（隐藏 QComboBox）
@@ -244,34 +447,38 @@ class AudioPlayer(QMainWindow):
         self.player.mediaStatusChanged.connect(self.handle_media_status_change)
         self.player.playbackStateChanged.connect(self.update_play_button_icon)
 
-        self.playlist_dialog = PlaylistDialog(self)
+        # 播放列表窗口在第一次点击“列表”时才创建
+        self.playlist_dialog = None
 
         # 自动加载上次播放列表
         if self.playlist_memory:
-            self.playlist = self.playlist_memory
-            self.playlist_dialog.playlist_widget.clear()
-            for f in self.playlist:
-                item = QListWidgetItem(os.path.basename(f))
-                item.setData(Qt.ItemDataRole.UserRole, f)
-                self.playlist_dialog.playlist_widget.addItem(item)
-            if self.current_file_path in self.playlist:
-                self.current_index = self.playlist.index(self.current_file_path)
+            self.set_playlist(self.playlist_memory, [os.path.basename(f) for f in self.playlist_memory])
+            if self.current_file_path in self._path_to_index:
                 self.playlist_file_double_clicked(self.current_file_path)
-                self.playlist_dialog.playlist_widget.setCurrentRow(self.current_index)
 
     def closeEvent(self, event: QCloseEvent):
+        # 窗口位置和大小的变化不会标记为脏，关闭时总是立即保存
+        self._settings_timer.stop()
+        self._settings_dirty = True
         self.save_settings()
         super().closeEvent(event)
 
     # ================== 核心方法 ==================
     def format_time(self, ms):
-        t = QTime(0, 0, 0).addMSecs(ms)
-        return t.toString("mm:ss") if ms < 3600000 else t.toString("hh:mm:ss")
+        m, s = divmod(ms // 1000, 60)
+        if ms < 3600000:
+            return f"{m:02d}:{s:02d}"
+        h, m = divmod(m, 60)
+        return f"{h:02d}:{m:02d}:{s:02d}"
 
     def set_position(self, pos):
         self.player.setPosition(pos)
 
     def update_position(self, pos):
+        # 时间标签只精确到秒，同一秒内的位置变化不再重绘滑块和标签
+        sec = pos // 1000
+        if sec == self._last_position_sec: return
+        self._last_position_sec = sec
         # 避免在用户拖动时更新滑块位置
         if not self.position_slider.isSliderDown(): 
             self.position_slider.setValue(pos)
@@ -279,26 +486,26 @@ class AudioPlayer(QMainWindow):
 
     def update_duration(self, dur):
         self.position_slider.setRange(0, dur)
-        self.duration_label.setText(self.format_time(dur))
+        self._last_position_sec = -1 # 时长变化后（如切换曲目）下一次位置更新必须刷新
+        sec = dur // 1000
+        if sec != self._last_duration_sec:
+            self._last_duration_sec = sec
+            self.duration_label.setText(self.format_time(dur))
 
     def toggle_device_combo(self):
         # 强制弹出下拉列表
         self.device_combo.showPopup() 
 
     def open_file(self):
-        filter_str = f"音频文件 ({' '.join(['*' + ext for ext in self.AUDIO_EXTENSIONS])})"
-        file_path, _ = QFileDialog.getOpenFileName(self, "选择音频文件", self.last_dir, filter_str)
+        file_path, _ = QFileDialog.getOpenFileName(self, "选择音频文件", self.last_dir, self.AUDIO_FILTER_STR)
         if not file_path: return
         self.last_dir = os.path.dirname(file_path)
         normalized = os.path.abspath(file_path).replace(os.sep, '/')
         self.load_directory_to_playlist(os.path.dirname(normalized))
         self.play_file(normalized)
-        try:
-            self.current_index = self.playlist.index(normalized)
-            self.playlist_dialog.playlist_widget.setCurrentRow(self.current_index)
-        except ValueError:
-            self.current_index = -1
-        self.save_settings()
+        self.current_index = self._path_to_index.get(normalized, -1)
+        self.sync_playlist_row()
+        self.mark_settings_dirty()
 
     # ********************** 添加刷新当前目录播放列表的方法 **********************
     def reload_current_directory_playlist(self):
@@ -316,13 +523,14 @@ class AudioPlayer(QMainWindow):
             was_playing = self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
             current_pos = self.player.position() if was_playing else 0
             
-            # 重新加载目录
+            # 重新加载目录，并丢弃已缓存的同名图片查找结果
             self.load_directory_to_playlist(current_dir)
+            _SIDECAR_CACHE.clear()
             
             # 尝试恢复播放的文件和位置
-            if self.current_file_path in self.playlist:
-                self.current_index = self.playlist.index(self.current_file_path)
-                self.playlist_dialog.playlist_widget.setCurrentRow(self.current_index)
+            self.current_index = self._path_to_index.get(self.current_file_path, -1)
+            if self.current_index >= 0:
+                self.sync_playlist_row()
 
                 # 重新设置播放源（PyQt6 Media Player 在更换播放列表后需要重新设置 Source 才能跳转）
                 self.player.setSource(QUrl.fromLocalFile(self.current_file_path))
@@ -336,25 +544,33 @@ class AudioPlayer(QMainWindow):
                 self.current_index = -1
                 self.current_file_path = None
         
-        self.save_settings()
+        self.mark_settings_dirty()
     # *************************************************************************
 
     def load_directory_to_playlist(self, directory):
-        self.playlist.clear()
-        self.playlist_dialog.playlist_widget.clear()
-        dir_obj = QDir(directory)
-        name_filters = [f"*{ext}" for ext in self.AUDIO_EXTENSIONS]
-        # 使用 QDir.Filter.Files 确保只获取文件
-        files = [f.absoluteFilePath().replace(os.sep, '/') for f in dir_obj.entryInfoList(name_filters, QDir.Filter.Files | QDir.Filter.NoDotAndDotDot)]
-        files.sort(key=lambda path: ''.join(lazy_pinyin(os.path.basename(path))))
-        self.playlist = files
+        # os.scandir 的文件名和路径直接来自目录读取结果，只按扩展名过滤（不区分大小写）
+        exts = self.AUDIO_EXT_LOWER
+        # 与 QDir.entryInfoList 一致：目录无法读取或已不存在时得到空列表
+        try:
+            with os.scandir(os.path.abspath(directory)) as entries:
+                found = [(e.path.replace(os.sep, '/'), e.name) for e in entries
+                         if e.name.lower().endswith(exts) and e.is_file() and not _is_hidden(e)]
+        except OSError:
+            found = []
+        # 文件名和排序键各计算一次，按排序结果重排路径和文件名两列
+        # scandir 不保证返回顺序，拼音相同（如同音字）时再按文件名（不区分大小写）排序，保证每次结果一致
+        keys = [(_pkey(name), name.lower()) for _, name in found]
+        order = sorted(range(len(found)), key=keys.__getitem__)
+        files = [found[i][0] for i in order]
+        self.set_playlist(files, [found[i][1] for i in order])
         self.playlist_memory = files # 同时更新设置内存
-        
-        for f in self.playlist:
-            item = QListWidgetItem(os.path.basename(f))
-            item.setData(Qt.ItemDataRole.UserRole, f)
-            self.playlist_dialog.playlist_widget.addItem(item)
-            
+
+    def set_playlist(self, files, names):
+        """替换播放列表；names 为与 files 对应的文件名"""
+        self.playlist = files
+        self._path_to_index = {p: i for i, p in enumerate(files)}
+        self.playlist_model.set_files(files, names)
+
     def play_file(self, file_path):
         self.current_file_path = file_path
         self.player.stop()
@@ -362,17 +578,14 @@ class AudioPlayer(QMainWindow):
         self.load_image(file_path)
         self.player.play()
         self.play_button.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPause))
-        self.save_settings()
+        self.mark_settings_dirty()
 
     def playlist_file_double_clicked(self, file_path):
-        try:
-            index = self.playlist.index(file_path)
-            if 0 <= index < len(self.playlist):
-                self.current_index = index
-                self.play_file(self.playlist[index])
-                self.playlist_dialog.playlist_widget.setCurrentRow(self.current_index)
-        except ValueError:
-            pass
+        index = self._path_to_index.get(file_path, -1)
+        if 0 <= index < len(self.playlist):
+            self.current_index = index
+            self.play_file(self.playlist[index])
+            self.sync_playlist_row()
 
     def play_pause(self):
         if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
@@ -390,17 +603,25 @@ class AudioPlayer(QMainWindow):
         if not self.playlist: return
         self.current_index = (self.current_index - 1) % len(self.playlist)
         self.play_file(self.playlist[self.current_index])
-        self.playlist_dialog.playlist_widget.setCurrentRow(self.current_index)
+        self.sync_playlist_row()
 
     def play_next(self):
         if not self.playlist: return
         self.current_index = (self.current_index + 1) % len(self.playlist)
         self.play_file(self.playlist[self.current_index])
-        self.playlist_dialog.playlist_widget.setCurrentRow(self.current_index)
+        self.sync_playlist_row()
 
     def show_playlist(self):
+        if self.playlist_dialog is None:
+            self.playlist_dialog = PlaylistDialog(self.playlist_model, self)
+            self.sync_playlist_row()
         self.playlist_dialog.show()
 
+    def sync_playlist_row(self):
+        # 播放列表窗口尚未创建时不需要同步，创建时会按 current_index 选中
+        if self.playlist_dialog is not None and self.current_index >= 0:
+            self.playlist_dialog.set_current_row(self.current_index)
+
     def handle_media_status_change(self, status):
         if status == QMediaPlayer.MediaStatus.EndOfMedia:
             self.play_next()
@@ -419,32 +640,37 @@ class AudioPlayer(QMainWindow):
             new_output.setVolume(self.audio_output.volume())
             self.audio_output = new_output
             self.player.setAudioOutput(self.audio_output)
-            if self.player.playbackState() != QMediaPlayer.PlaybackState.StoppedState and self.current_file_path:
+            if RESOURCE_ON_DEVICE_SWITCH and self.current_file_path \
+                    and self.player.playbackState() != QMediaPlayer.PlaybackState.StoppedState:
                 pos = self.player.position()
                 self.player.setSource(QUrl.fromLocalFile(self.current_file_path))
                 self.player.setPosition(pos)
                 self.player.play()
-            self.save_settings()
+            self.mark_settings_dirty()
 
     def load_image(self, audio_path):
-        base_path = os.path.splitext(audio_path)[0]
-        self.current_image_path = None
-        for ext in ['.jpg', '.jpeg', '.png', '.bmp', '.gif']:
-            image_path = base_path + ext
-            if os.path.exists(image_path):
-                self.current_image_path = image_path
-                break
-        if self.current_image_path:
-            pixmap = QPixmap(self.current_image_path)
-            if pixmap.isNull():
-                self.image_label.setOriginalPixmap(QPixmap())
-            else:
-                self.image_label.setOriginalPixmap(pixmap)
-        else:
+        # 图片的查找和解码放到线程池中进行，不阻塞开始播放
+        self._image_request_id += 1
+        loader = ImageLoader(self._image_request_id, audio_path, self.screen().availableGeometry().size())
+        loader.signals.done.connect(self.image_loaded)
+        QThreadPool.globalInstance().start(loader)
+
+    def image_loaded(self, request_id, image_path, image):
+        # 快速切换曲目时，丢弃已经过期的加载结果
+        if request_id != self._image_request_id: return
+        self.current_image_path = image_path or None
+        if image.isNull():
             self.image_label.setOriginalPixmap(QPixmap())
+        else:
+            self.image_label.setOriginalPixmap(QPixmap.fromImage(image))
 
 # ================== 保存/加载设置 ==================
+    def mark_settings_dirty(self):
+        self._settings_dirty = True
+        self._settings_timer.start()
+
     def save_settings(self):
+        if not self._settings_dirty: return
         data = {
             "last_dir": self.last_dir,
             "last_device_desc": self.last_device_desc,
@@ -452,8 +678,12 @@ class AudioPlayer(QMainWindow):
             "current_file_path": self.current_file_path,
             "window_geometry": self.saveGeometry().toBase64().data().decode('utf-8')
         }
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
+        # 先写临时文件再替换，避免写到一半崩溃时损坏设置文件
+        tmp_path = SETTINGS_FILE + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, SETTINGS_FILE)
+        self._settings_dirty = False
 
     def load_settings(self):
         if os.path.exists(SETTINGS_FILE):